@@ -1,8 +1,13 @@
 from __future__ import annotations
+import os
+import queue
+import threading
 import pandas as pd
 import sqlite3
+from pathlib import Path
+from itertools import chain, islice
 from contextlib import contextmanager
-from typing import Any, Iterable, List, Optional, Sequence, Tuple, Dict, Union
+from typing import Any, Iterable, Iterator, List, Optional, Sequence, Tuple, Dict, Union
 
 class SQLiteClient:
     """
@@ -15,44 +20,100 @@ class SQLiteClient:
     - Executemany for bulk inserts
     - Convenience create_table from a schema dict
     - Optional pandas DataFrame helpers (if pandas installed)
+    - One writer connection plus a pool of read-only connections for SELECTs
     """
 
-    def __init__(self, db_path: str, timeout: float = 30.0, pragmas: Optional[Dict[str, Any]] = None):
+    # Row count after which bulk loads refresh planner statistics with ANALYZE
+    ANALYZE_THRESHOLD = 10_000
+
+    # In-memory (":memory:") and temporary ("") databases live only on the writer connection
+    PRIVATE_DB_PATHS = (":memory:", "")
+
+    def __init__(
+        self, db_path: str, timeout: float = 30.0, pragmas: Optional[Dict[str, Any]] = None,
+        read_pool_size: int = 4
+    ):
         """
         Args:
             db_path: Path to .db file (e.g., r"D:\\nba.db")
             timeout: SQLite lock timeout in seconds
             pragmas: Optional PRAGMAs to set after connect, e.g. {"journal_mode": "WAL", "synchronous": "NORMAL"}
+            read_pool_size: Read-only connections opened for SELECTs (0 = read on the writer).
+                Under WAL these read concurrently with each other and with the writer.
         """
         self.db_path = db_path
         self.timeout = timeout
+        self.read_pool_size = 0 if db_path in self.PRIVATE_DB_PATHS else read_pool_size
         self._conn: Optional[sqlite3.Connection] = None
+        self._read_pool: "queue.Queue[sqlite3.Connection]" = queue.Queue()
+        self._read_conns: List[sqlite3.Connection] = []
+        self._sql_cache: Dict[Tuple[Any, ...], str] = {}  # generated INSERT/UPSERT text
+        # the writer is shared across threads: _write_lock serializes writes and
+        # transactions, _txn_owner is the thread id of the open transaction()
+        self._write_lock = threading.RLock()
+        self._txn_owner: Optional[int] = None
         self._pragmas = pragmas or {
             "journal_mode": "WAL",
             "synchronous": "NORMAL",
+            "temp_store": "MEMORY",
+            "cache_size": -64000,       # negative = KiB, i.e. ~64MB page cache
+            "mmap_size": 268435456,     # 256MB
             "foreign_keys": 1
         }
 
     # ---------- Connection management ----------
     def connect(self) -> None:
+        # isolation_level=None puts sqlite3 in autocommit mode: standalone
+        # statements commit on their own and transaction() controls batching
         if self._conn is None:
-            conn = sqlite3.connect(self.db_path, timeout=self.timeout)
+            conn = sqlite3.connect(
+                self.db_path,
+                timeout=self.timeout,
+                isolation_level=None,
+                check_same_thread=False,
+                cached_statements=1024  # prepared-statement cache (default 128)
+            )
             conn.row_factory = sqlite3.Row  # enables dict-like access
             self._conn = conn
             self._apply_pragmas()
+            # readers open after the writer so the file (and WAL mode) already exist
+            for _ in range(self.read_pool_size):
+                reader = self._open_reader()
+                self._read_conns.append(reader)
+                self._read_pool.put(reader)
 
     def _apply_pragmas(self) -> None:
-        if not self._conn:
+        if not self._conn or not self._pragmas:
             return
-        cur = self._conn.cursor()
-        for k, v in self._pragmas.items():
-            cur.execute(f"PRAGMA {k}={v}")
-        cur.close()
+        script = " ".join(f"PRAGMA {k}={v};" for k, v in self._pragmas.items())
+        self._conn.executescript(script)
+
+    def _open_reader(self) -> sqlite3.Connection:
+        """Open a read-only (mode=ro, query_only) connection with the same per-connection PRAGMAs."""
+        uri = f"{Path(self.db_path).resolve().as_uri()}?mode=ro"
+        reader = sqlite3.connect(
+            uri,
+            uri=True,
+            timeout=self.timeout,
+            isolation_level=None,
+            check_same_thread=False,
+            cached_statements=1024
+        )
+        reader.row_factory = sqlite3.Row
+        # journal_mode is a property of the database file, already set by the writer
+        pragmas = {k: v for k, v in self._pragmas.items() if k != "journal_mode"}
+        pragmas["query_only"] = 1
+        reader.executescript(" ".join(f"PRAGMA {k}={v};" for k, v in pragmas.items()))
+        return reader
 
     def close(self) -> None:
         if self._conn is not None:
             self._conn.close()
             self._conn = None
+        for reader in self._read_conns:
+            reader.close()
+        self._read_conns.clear()
+        self._read_pool = queue.Queue()
 
     def __enter__(self) -> "SQLiteClient":
         self.connect()
@@ -74,56 +135,176 @@ class SQLiteClient:
         assert self._conn is not None
         return self._conn
 
+    @contextmanager
+    def read_conn(self):
+        """
+        Borrow a read-only connection from the pool (blocks until one is free).
+        The thread that owns the open transaction() reads on the writer so it
+        sees its own uncommitted rows; every other thread gets a pooled reader.
+        Without a pool, reads use the writer once no other thread's
+        transaction is open, so they never see uncommitted data.
+        """
+        conn = self.conn
+        if self._owns_transaction():
+            yield conn
+            return
+        if not self._read_conns:
+            with self._write_lock:
+                yield conn
+            return
+        reader = self._read_pool.get()
+        try:
+            yield reader
+        finally:
+            self._read_pool.put(reader)
+
     # ---------- Transaction helper ----------
+    def _owns_transaction(self) -> bool:
+        """True if the calling thread is the one that opened the current transaction()."""
+        return self._txn_owner == threading.get_ident()
+
     @contextmanager
     def transaction(self):
-        """Explicit transaction block with commit/rollback."""
-        try:
+        """
+        Explicit transaction block with commit/rollback.
+        Opens with BEGIN IMMEDIATE so the write lock is taken up front.
+        Nested calls from the same thread join the outer transaction; other
+        threads wait for it to finish and then start their own.
+        """
+        if self._owns_transaction():
             yield
-            self.conn.commit()
-        except Exception:
-            self.conn.rollback()
-            raise
+            return
+        with self._write_lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            self._txn_owner = threading.get_ident()
+            try:
+                yield
+                self.conn.commit()
+            except Exception:
+                self.conn.rollback()
+                raise
+            finally:
+                self._txn_owner = None
 
     # ---------- Core methods ----------
     def execute(self, sql: str, params: Sequence[Any] | None = None) -> None:
-        """Run a DDL/DML statement. Commits immediately."""
+        """
+        Run a DDL/DML statement.
+        Autocommits on its own; inside transaction() it commits with the block.
+        Waits while another thread has a transaction open on the shared writer.
+        """
+        with self._write_lock:
+            cur = self.conn.cursor()
+            cur.execute(sql, params or [])
+            cur.close()
+
+    def executemany(self, sql: str, param_list: Iterable[Sequence[Any]]) -> int:
+        """
+        Run a parameterized statement for many rows (bulk insert/update) in one transaction.
+        Returns the number of rows modified.
+        """
         cur = self.conn.cursor()
-        cur.execute(sql, params or [])
-        self.conn.commit()
+        with self.transaction():
+            cur.executemany(sql, param_list)
+        rowcount = cur.rowcount
         cur.close()
+        return rowcount
 
-    def executemany(self, sql: str, param_list: Iterable[Sequence[Any]]) -> None:
-        """Run a parameterized statement for many rows (bulk insert/update)."""
+    def stream_insert(
+        self, sql: str, param_iter: Iterable[Sequence[Any]], chunk: int = 10_000
+    ) -> None:
+        """
+        Feed rows from any iterable/generator to a parameterized statement in
+        batches of `chunk`, all inside one transaction. Only one batch is held
+        in memory, so scrape functions can yield rows straight into SQLite.
+        """
+        it = iter(param_iter)
         cur = self.conn.cursor()
-        cur.executemany(sql, param_list)
-        self.conn.commit()
+        with self.transaction():
+            while batch := list(islice(it, chunk)):
+                cur.executemany(sql, batch)
         cur.close()
 
     def query(
         self, sql: str, params: Sequence[Any] | None = None
     ) -> List[Dict[str, Any]]:
         """Run a SELECT and return list of dict rows."""
-        cur = self.conn.cursor()
-        cur.execute(sql, params or [])
-        rows = [dict(row) for row in cur.fetchall()]
-        cur.close()
+        with self.read_conn() as conn:
+            cur = conn.cursor()
+            cur.row_factory = None  # plain tuples; zip with names once per row
+            cur.execute(sql, params or [])
+            cols = [d[0] for d in cur.description or []]
+            rows = [dict(zip(cols, row)) for row in cur]
+            cur.close()
         return rows
 
+    def query_tuples(
+        self, sql: str, params: Sequence[Any] | None = None
+    ) -> Tuple[List[str], List[Tuple[Any, ...]]]:
+        """
+        Run a SELECT and return (column_names, list of row tuples), no dicts.
+        e.g. pd.DataFrame(rows, columns=cols)
+        """
+        with self.read_conn() as conn:
+            cur = conn.cursor()
+            cur.row_factory = None
+            cur.execute(sql, params or [])
+            cols = [d[0] for d in cur.description or []]
+            rows = cur.fetchall()
+            cur.close()
+        return cols, rows
+
+    def iter_query(
+        self, sql: str, params: Sequence[Any] | None = None, chunk_size: int = 1000
+    ) -> Iterator[Dict[str, Any]]:
+        """Run a SELECT and lazily yield dict rows, fetching chunk_size rows at a time."""
+        with self.read_conn() as conn:
+            cur = conn.cursor()
+            cur.arraysize = chunk_size
+            try:
+                cur.execute(sql, params or [])
+                while chunk := cur.fetchmany():
+                    yield from (dict(row) for row in chunk)
+            finally:
+                cur.close()
+
+    def query_columns(
+        self, sql: str, params: Sequence[Any] | None = None
+    ) -> Dict[str, List[Any]]:
+        """
+        Run a SELECT and return columns as {column_name: [values, ...]}.
+        Can be passed straight to pd.DataFrame(...) without per-row dicts.
+        """
+        with self.read_conn() as conn:
+            cur = conn.cursor()
+            cur.row_factory = None  # plain tuples, no sqlite3.Row objects
+            cur.execute(sql, params or [])
+            names = [d[0] for d in cur.description or []]
+            rows = cur.fetchall()
+            cur.close()
+        if not rows:
+            return {name: [] for name in names}
+        return {name: list(values) for name, values in zip(names, zip(*rows))}
+
     def query_one(
         self, sql: str, params: Sequence[Any] | None = None
     ) -> Optional[Dict[str, Any]]:
         """Return first row as dict (or None)."""
-        cur = self.conn.cursor()
-        cur.execute(sql, params or [])
-        row = cur.fetchone()
-        cur.close()
+        with self.read_conn() as conn:
+            cur = conn.cursor()
+            cur.execute(sql, params or [])
+            row = cur.fetchone()
+            cur.close()
         return dict(row) if row else None
 
     # ---------- Schema & upserts ----------
-    def create_table(self, name: str, schema: Dict[str, str], if_not_exists: bool = True) -> None:
+    def create_table(
+        self, name: str, schema: Dict[str, str], if_not_exists: bool = True,
+        indexes: Optional[Sequence[Tuple[str, Sequence[str]]]] = None
+    ) -> None:
         """
-        Create a table from a {column_name: SQL_type_and_constraints} mapping.
+        Create a table from a {column_name: SQL_type_and_constraints} mapping,
+        plus optional (index_name, [columns]) indexes.
         Example:
             schema = {
                 "player_id": "INTEGER PRIMARY KEY",
@@ -131,18 +312,107 @@ class SQLiteClient:
                 "pts": "REAL",
                 "created_at": "TIMESTAMP DEFAULT CURRENT_TIMESTAMP"
             }
+            indexes = [("idx_players_name", ["name"])]
         """
         cols = ", ".join([f"{col} {decl}" for col, decl in schema.items()])
         ine = "IF NOT EXISTS " if if_not_exists else ""
         ddl = f"CREATE TABLE {ine}{name} ({cols});"
-        self.execute(ddl)
+        with self.transaction():
+            self.execute(ddl)
+            for idx_name, idx_cols in indexes or []:
+                self.execute(
+                    f"CREATE INDEX IF NOT EXISTS {idx_name} ON {name} ({', '.join(idx_cols)});"
+                )
+
+    def analyze(self, table: Optional[str] = None) -> None:
+        """Refresh the query planner's statistics (for one table or the whole database)."""
+        self.execute(f"ANALYZE {table}" if table else "ANALYZE")
+
+    def _insert_sql(self, table: str, cols: Tuple[str, ...]) -> str:
+        """Build (once) the INSERT statement for a table/column tuple."""
+        key = ("ins", table, cols)
+        sql = self._sql_cache.get(key)
+        if sql is None:
+            placeholders = ", ".join(["?"] * len(cols))
+            sql = f"INSERT INTO {table} ({', '.join(cols)}) VALUES ({placeholders})"
+            self._sql_cache[key] = sql
+        return sql
+
+    def _upsert_sql(self, table: str, cols: Tuple[str, ...], conflict_cols: Tuple[str, ...]) -> str:
+        """Build (once) the INSERT ... ON CONFLICT statement for a table/column/conflict tuple."""
+        key = ("ups", table, cols, conflict_cols)
+        sql = self._sql_cache.get(key)
+        if sql is None:
+            placeholders = ", ".join(["?"] * len(cols))
+            assignments = ", ".join([f"{c}=excluded.{c}" for c in cols if c not in conflict_cols])
+            sql = (
+                f"INSERT INTO {table} ({', '.join(cols)}) VALUES ({placeholders}) "
+                f"ON CONFLICT({', '.join(conflict_cols)}) DO UPDATE SET {assignments};"
+            )
+            self._sql_cache[key] = sql
+        return sql
 
     def insert(self, table: str, row: Dict[str, Any]) -> None:
-        cols = ", ".join(row.keys())
-        placeholders = ", ".join(["?"] * len(row))
-        sql = f"INSERT INTO {table} ({cols}) VALUES ({placeholders})"
+        sql = self._insert_sql(table, tuple(row))
         self.execute(sql, list(row.values()))
 
+    def bulk_insert(self, table: str, rows: Iterable[Dict[str, Any]]) -> None:
+        """
+        Insert many rows (all with the same keys) with a single
+        BEGIN IMMEDIATE ... COMMIT instead of one commit per row.
+        """
+        self.insert_many(table, rows)
+
+    def insert_many(self, table: str, rows: Iterable[Dict[str, Any]]) -> None:
+        """
+        Bulk insert an iterable of dict rows in one transaction.
+        Column order comes from the first row; every row must have the same keys.
+        Rows are streamed to executemany, so a generator is never materialized.
+        """
+        peeked = self._peek_rows(rows)
+        if peeked is None:
+            return
+        cols, rows = peeked
+        inserted = self.executemany(self._insert_sql(table, cols), self._row_params(rows, cols))
+        if inserted > self.ANALYZE_THRESHOLD:
+            self.analyze(table)
+
+    def upsert_many(
+        self, table: str, rows: Iterable[Dict[str, Any]], conflict_cols: Union[str, Sequence[str]]
+    ) -> None:
+        """
+        Bulk version of upsert(): one statement, one transaction for all rows.
+        Requires a UNIQUE or PRIMARY KEY constraint on conflict_cols.
+        """
+        if isinstance(conflict_cols, str):
+            conflict_cols = [conflict_cols]
+        peeked = self._peek_rows(rows)
+        if peeked is None:
+            return
+        cols, rows = peeked
+        sql = self._upsert_sql(table, cols, tuple(conflict_cols))
+        self.executemany(sql, self._row_params(rows, cols))
+
+    @staticmethod
+    def _peek_rows(
+        rows: Iterable[Dict[str, Any]]
+    ) -> Optional[Tuple[Tuple[str, ...], Iterable[Dict[str, Any]]]]:
+        """Return (columns of the first row, rows with the first row put back) or None if empty."""
+        it = iter(rows)
+        first = next(it, None)
+        if first is None:
+            return None
+        return tuple(first.keys()), chain([first], it)
+
+    @staticmethod
+    def _row_params(rows: Iterable[Dict[str, Any]], cols: Tuple[str, ...]):
+        """Yield each row's values in column order, rejecting rows with different keys."""
+        cols_set = set(cols)
+        for row in rows:
+            if row.keys() != cols_set:
+                raise ValueError(f"Row keys {list(row.keys())} do not match columns {list(cols)}")
+            yield tuple(row[c] for c in cols)
+
     def upsert(self, table: str, row: Dict[str, Any], conflict_cols: Union[str, Sequence[str]]) -> None:
         """
         SQLite UPSERT (requires a UNIQUE or PRIMARY KEY constraint on conflict_cols).
@@ -150,23 +420,16 @@ class SQLiteClient:
         """
         if isinstance(conflict_cols, str):
             conflict_cols = [conflict_cols]
-        cols = list(row.keys())
-        placeholders = ", ".join(["?"] * len(cols))
-        assignments = ", ".join([f"{c}=excluded.{c}" for c in cols if c not in conflict_cols])
-        sql = (
-            f"INSERT INTO {table} ({', '.join(cols)}) VALUES ({placeholders}) "
-            f"ON CONFLICT({', '.join(conflict_cols)}) DO UPDATE SET {assignments};"
-        )
-        self.execute(sql, [row[c] for c in cols])
+        sql = self._upsert_sql(table, tuple(row), tuple(conflict_cols))
+        self.execute(sql, list(row.values()))
 
     def insert_dataframe(self, df: pd.DataFrame, table: str) -> None:
         """
         Insert all rows from a pandas DataFrame into a table.
-        Equivalent to multiple INSERT statements.
+        Runs as one executemany inside a single transaction.
         """
         rows = df.to_dict(orient="records")  # list of dicts: [{"col": val, ...}, ...]
-        for row in rows:
-            self.insert(table, row)
+        self.insert_many(table, rows)
 
     def upsert_dataframe(self, df: pd.DataFrame, table: str, conflict_cols: Union[str, Sequence[str]]) -> None:
         """
@@ -177,14 +440,40 @@ class SQLiteClient:
             conflict_cols = [conflict_cols]
 
         rows = df.to_dict(orient="records")
-        for row in rows:
-            self.upsert(table, row, conflict_cols)
+        self.upsert_many(table, rows, conflict_cols)
 
     # ---------- Pandas helpers ----------
     def to_dataframe(self, sql: str, params: Sequence[Any] | None = None):
+        """
+        Run a SELECT into a DataFrame.
+        Unparameterized queries on a file database are read column-wise through
+        connectorx or ADBC when one is installed (no per-row Python objects);
+        otherwise, or inside this thread's transaction(), falls back to pandas.
+        """
         if pd is None:
             raise ImportError("pandas is not installed. `pip install pandas`")
-        return pd.read_sql_query(sql, self.conn, params=params or [])
+        if not params and self.db_path not in self.PRIVATE_DB_PATHS and not self._owns_transaction():
+            df = self._arrow_dataframe(sql)
+            if df is not None:
+                return df
+        with self.read_conn() as conn:
+            return pd.read_sql_query(sql, conn, params=params or [])
+
+    def _arrow_dataframe(self, sql: str):
+        """Read a query with connectorx or ADBC on their own connection; None if neither is installed."""
+        path = os.path.abspath(self.db_path)
+        try:
+            import connectorx as cx
+            return cx.read_sql(f"sqlite://{path}", sql, return_type="pandas")
+        except ImportError:
+            pass
+        try:
+            from adbc_driver_sqlite import dbapi
+        except ImportError:
+            return None
+        with dbapi.connect(path) as conn, conn.cursor() as cur:
+            cur.execute(sql)
+            return cur.fetch_arrow_table().to_pandas()
 
     def dataframe_to_table(
         self,
@@ -194,10 +483,41 @@ class SQLiteClient:
         """
         Write a pandas DataFrame to a table (create/replace/append).
         if_exists in {'fail','replace','append'}
+
+        df.to_sql() commits on its own after creating the table, which would end
+        the held transaction early, so only the CREATE TABLE text comes from pandas
+        and the schema change plus every row run in one transaction here.
         """
         if pd is None:
             raise ImportError("pandas is not installed. `pip install pandas`")
-        df.to_sql(table, self.conn, if_exists=if_exists, index=index, dtype=dtype)
+        if if_exists not in ("fail", "replace", "append"):
+            raise ValueError(f"'{if_exists}' is not valid for if_exists")
+        frame = df.reset_index() if index else df
+        quoted = '"' + table.replace('"', '""') + '"'
+        cols = ", ".join('"' + str(c).replace('"', '""') + '"' for c in frame.columns)
+        placeholders = ", ".join(["?"] * len(frame.columns))
+        sql = f"INSERT INTO {quoted} ({cols}) VALUES ({placeholders})"
+
+        # sqlite3 can't bind Timestamps/NaT/pd.NA; store datetimes as ISO text like to_sql does
+        values = frame.astype(object)
+        for col in frame.select_dtypes(include=["datetime", "datetimetz"]).columns:
+            values[col] = frame[col].map(lambda v: None if pd.isna(v) else v.isoformat(" "))
+        values = values.where(frame.notna(), None)
+
+        with self.transaction():
+            exists = self.conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+            ).fetchone() is not None
+            if exists and if_exists == "fail":
+                raise ValueError(f"Table '{table}' already exists.")
+            if exists and if_exists == "replace":
+                self.conn.execute(f"DROP TABLE {quoted}")
+            if not exists or if_exists == "replace":
+                self.conn.execute(pd.io.sql.get_schema(frame, table, con=self.conn, dtype=dtype))
+            self.executemany(sql, values.itertuples(index=False, name=None))
+        # a freshly (re)created or heavily appended table needs new planner stats
+        if if_exists != "append" or len(df) > self.ANALYZE_THRESHOLD:
+            self.analyze(table)
 
 ### TESTING
 
@@ -26,6 +26,13 @@ conn.close()
 import sqlite3
 import pandas as pd
 
+# SQLite caps the bound parameters per statement (999 before 3.32.0, 32766 after),
+# so a multi-row INSERT can carry at most that many values / the column count rows
+SQLITE_MAX_VARIABLES = 999 if sqlite3.sqlite_version_info < (3, 32, 0) else 32766
+
+def multi_chunksize(df):
+    return max(1, SQLITE_MAX_VARIABLES // len(df.columns))
+
 # # Example DataFrame
 # df = pd.DataFrame({
 #     "name": ["LeBron James", "Stephen Curry", "Nikola Jokic"],
@@ -36,7 +43,7 @@ import pandas as pd
 # Connect to SQLite DB (creates table if not exists)
 with sqlite3.connect("nba.db") as conn:
     # Write DataFrame to a table called "players"
-    df.to_sql("players", conn, if_exists="append", index=False)
+    df.to_sql("players", conn, if_exists="append", index=False, method="multi", chunksize=multi_chunksize(df))
 
     # Verify by reading back
     check = pd.read_sql("SELECT * FROM players", conn)
@@ -63,9 +70,20 @@ west_df = west_df.rename(columns={'WL%':'WLperc', 'Eastern Conference': 'team_na
 print(west_df)
 # Connect to SQLite DB (creates table if not exists)
 with sqlite3.connect("nba.db") as conn:
+    # Load-friendly settings: WAL, fewer fsyncs, temp tables/indexes in RAM
+    conn.executescript(
+        "PRAGMA journal_mode=WAL; PRAGMA synchronous=NORMAL; "
+        "PRAGMA temp_store=MEMORY; PRAGMA cache_size=-200000;"
+    )
+
     # Write DataFrame to a table called "players"
-    # east_df.to_sql("conference_data", conn, if_exists="append", index=False)
-    west_df.to_sql("conference_data", conn, if_exists="append", index=False)
+    # one multi-row INSERT ... VALUES per chunk, sized to SQLite's variable limit;
+    # to_sql commits on its own once the rows are written
+    # east_df.to_sql("conference_data", conn, if_exists="append", index=False, method="multi", chunksize=multi_chunksize(east_df))
+    west_df.to_sql(
+        "conference_data", conn, if_exists="append", index=False,
+        method="multi", chunksize=multi_chunksize(west_df)
+    )
 
     # Verify by reading back
     check = pd.read_sql("SELECT * FROM conference_data", conn)
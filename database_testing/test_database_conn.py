@@ -0,0 +1,57 @@
+import os
+import sys
+import tempfile
+import unittest
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from database_conn import SQLiteClient
+
+
+class DataFrameToTableTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db = SQLiteClient(os.path.join(self.tmp.name, "nba.db"))
+        self.df = pd.DataFrame({"player": ["LeBron James", "Stephen Curry"], "PTS": [25.7, 26.4]})
+        self.db.dataframe_to_table(self.df, "players", if_exists="replace")
+
+    def tearDown(self):
+        self.db.close()
+        self.tmp.cleanup()
+
+    def test_round_trip(self):
+        out = self.db.query("SELECT player, PTS FROM players ORDER BY player")
+        self.assertEqual(out, self.df.to_dict(orient="records"))
+
+    def test_rollback_leaves_table_unchanged(self):
+        before = self.db.query("SELECT * FROM players ORDER BY player")
+        extra = pd.DataFrame({"player": ["Nikola Jokic"], "PTS": [26.4]})
+        with self.assertRaises(RuntimeError):
+            with self.db.transaction():
+                self.db.dataframe_to_table(extra, "players", if_exists="append")
+                self.db.dataframe_to_table(extra, "players", if_exists="replace")
+                raise RuntimeError("abort")
+        self.assertFalse(self.db.conn.in_transaction)
+        self.assertEqual(self.db.query("SELECT * FROM players ORDER BY player"), before)
+
+    def test_rollback_drops_new_table(self):
+        with self.assertRaises(RuntimeError):
+            with self.db.transaction():
+                self.db.dataframe_to_table(self.df, "rookies")
+                raise RuntimeError("abort")
+        self.assertIsNone(self.db.query_one("SELECT name FROM sqlite_master WHERE name = 'rookies'"))
+
+
+class PrivateDatabaseTest(unittest.TestCase):
+    def test_reads_use_the_writer(self):
+        for path in (":memory:", ""):
+            db = SQLiteClient(path)
+            db.dataframe_to_table(pd.DataFrame({"team": ["OKC"]}), "teams")
+            self.assertEqual(db.query("SELECT team FROM teams"), [{"team": "OKC"}])
+            self.assertEqual(db.to_dataframe("SELECT team FROM teams")["team"].tolist(), ["OKC"])
+            db.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
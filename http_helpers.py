@@ -0,0 +1,52 @@
+import math
+import threading
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+def retry_after_seconds(value, default):
+    '''
+    Seconds to wait according to a Retry-After header, which may be either
+    a number of seconds or an HTTP date
+
+    Args:
+        value - String or None (the header value)
+        default - Float, used when the header is missing or unparsable
+
+    Returns:
+        Float, never negative
+    '''
+    if value is None:
+        return default
+
+    try:
+        seconds = float(value)
+    except ValueError:
+        ### HTTP-date form (ex. 'Wed, 21 Oct 2015 07:28:00 GMT')
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return default
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=timezone.utc)
+        seconds = (when - datetime.now(timezone.utc)).total_seconds()
+
+    if not math.isfinite(seconds):
+        return default
+
+    return max(0.0, seconds)
+
+# --------------------------------------------------------------------------- #
+
+### basketball-reference starts answering 429 at roughly 20 requests a minute
+REQUESTS_PER_MINUTE = 20
+_RATE_LIMIT = threading.BoundedSemaphore(REQUESTS_PER_MINUTE)
+
+def throttle():
+    '''
+    Block until a request slot is free, then give the slot back after a minute.
+    One bucket per process, shared by every scraper that imports it
+    '''
+    _RATE_LIMIT.acquire()
+    timer = threading.Timer(60, _RATE_LIMIT.release)
+    timer.daemon = True
+    timer.start()
@@ -2,21 +2,101 @@ import re
 import pandas as pd
 import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
-import urllib.request
+import lxml.html
 import time
 import random
+import threading
+import asyncio
+import importlib.util
+import functools
+from concurrent.futures import ThreadPoolExecutor
 import matplotlib.pyplot as plt
+from http_helpers import retry_after_seconds, throttle as _throttle
+
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
 
 # --------------------------------------------------------------------------- #
 # get_soup(url)
+# get_html(url)
+# parse(html)
 # get_roster(team_name, season)
 # get_game_data(team, opp, url)
+# get_games_data(games, max_workers)
 # get_player_data(name, season)
+# fetch_many(names, season, max_workers)
+# aget_many(names, season, max_concurrency)      (async)
 # fantasy_score_model(player_data)
 # create models(player_data)      
 # --------------------------------------------------------------------------- #
 
+### 'W 110-102' -> ('W', '110', '102')
+_RESULT_RE = re.compile(r'^([WL]).*?(\d+)\s*-\s*(\d+)')
+
+### one pooled session so repeat requests to basketball-reference reuse the
+### same keep-alive connection instead of a new TCP + TLS handshake each time.
+### With requests_cache installed, successful pages are also kept on disk for
+### a week so re-runs never hit the site for pages already seen
+if requests_cache is not None:
+    _SESSION = requests_cache.CachedSession(
+        'bbref_cache', expire_after=86400 * 7, allowable_codes=(200,)
+    )
+else:
+    _SESSION = requests.Session()
+
+### real browser user agents; get_html picks one per request so the scraper
+### doesn't look like a single bot hammering the site
+_UA_POOL = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+    '(KHTML, like Gecko) Chrome/124.0 Safari/537.36',
+    'Mozilla/5.0 (X11; Linux x86_64; rv:124.0) Gecko/20100101 Firefox/124.0',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 14_4) AppleWebKit/605.1.15 '
+    '(KHTML, like Gecko) Version/17.4 Safari/605.1.15',
+)
+
+### Accept-Encoding is left to requests: gzip / deflate, plus br when brotli
+### is installed
+_SESSION.headers.update({
+    'User-Agent': _UA_POOL[0],
+    'Accept-Language': 'en-US,en;q=0.9'
+})
+### 429 / 5xx answers are retried with exponential backoff (honouring the
+### server's Retry-After); once retries run out the last response is handed
+### back so raise_for_status raises a normal HTTPError
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=16,
+    max_retries=Retry(
+        total=5,
+        backoff_factor=0.8,
+        status_forcelist=(429, 500, 502, 503, 504),
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+))
+
+### at most this many requests in flight to basketball-reference at once,
+### however many threads are scraping
+_MAX_CONCURRENT_REQUESTS = 4
+_HOST_SLOTS = threading.BoundedSemaphore(_MAX_CONCURRENT_REQUESTS)
+
+# --------------------------------------------------------------------------- #
+
 def get_soup(url):
     '''
     Create a soup object of a web url
@@ -27,16 +107,70 @@ def get_soup(url):
     Returns:
         soup - BeautifulSoup object
     '''
+    ### create the soup object (lxml is the C parser, much faster than html.parser)
+    soup = BeautifulSoup(get_html(url), 'lxml')
+
+    return soup
+
+# --------------------------------------------------------------------------- #
+
+def get_html(url):
+    '''
+    Fetch the raw bytes of a web url
+
+    Args: 
+        url - String (ex. https://basketball-reference.com/)
+
+    Returns:
+        bytes
+    '''
     try:
-        with urllib.request.urlopen(url) as response:
-            html = response.read()
-    except urllib.error.URLError as e:
-        print(f"Error fetching URL: {e.reason}")
+        with _HOST_SLOTS:
+            response = _SESSION.get(
+                url, timeout=10,
+                headers={'User-Agent': random.choice(_UA_POOL)}
+            )
+        response.raise_for_status()
+    except requests.RequestException as e:
+        print(f"Error fetching URL: {e}")
+        raise
+
+    return response.content
 
-    ### create the soup object
-    soup = BeautifulSoup(html, 'html.parser')
+# --------------------------------------------------------------------------- #
 
-    return soup
+def parse(html):
+    '''
+    Parse page bytes for CSS selection. Uses selectolax's C lexbor engine
+    when it's installed (many times faster than bs4 for select + text),
+    otherwise a BeautifulSoup on lxml
+
+    Args:
+        html - bytes (ex. get_html(url))
+
+    Returns:
+        LexborHTMLParser or BeautifulSoup object (read it with select_text)
+    '''
+    if LexborHTMLParser is not None:
+        return LexborHTMLParser(html)
+
+    return BeautifulSoup(html, 'lxml')
+
+def select_text(tree, css):
+    '''
+    Stripped text of every node matching a CSS selector, in document order
+
+    Args:
+        tree - object returned by parse()
+        css - String (ex. 'td[data-stat="player"]')
+
+    Returns:
+        list of Strings
+    '''
+    if LexborHTMLParser is not None and isinstance(tree, LexborHTMLParser):
+        return [node.text(strip=True) for node in tree.css(css)]
+
+    return [node.get_text(strip=True) for node in tree.select(css)]
 
 # --------------------------------------------------------------------------- #
 
@@ -51,21 +185,24 @@ def get_roster(team_name, season):
     Returns:
         roster - Dataframe
     '''
+    ### copy so callers can't modify the cached frame
+    return _get_roster(team_name, season).copy()
+
+@functools.lru_cache(maxsize=1024)
+def _get_roster(team_name, season):
+    '''
+    get_roster, memoized per (team_name, season) for the life of the process
+    '''
     ### call get_html to request data from url
-    soup = get_soup(
+    tree = parse(get_html(
         f'https://www.basketball-reference.com/teams/{team_name}/{season}.html'
-    )
-
-    ### extract player names from basketball-reference
-    team = soup.select('td[data-stat="player"],td[data-stat="pos"]')
-    roster_data = [data.get_text(strip=True) for data in team]
+    ))
 
-    roster = {'players': [], 'positions': []}
-    for i in range(0, len(roster_data), 2):
-        roster['players'].append(roster_data[i])
-        roster['positions'].append(roster_data[i + 1])
-
-    roster = pd.DataFrame(roster)
+    ### extract player names and positions from the roster table
+    roster = pd.DataFrame({
+        'players': select_text(tree, 'table#roster td[data-stat="player"]'),
+        'positions': select_text(tree, 'table#roster td[data-stat="pos"]')
+    })
 
     return roster
 
@@ -88,55 +225,68 @@ def get_game_data(team, opp, url):
     other_url = url
     other_url = other_url.replace(team, opp)
 
-    ### attempt to scrape the site (try not to get ip banned)
-    for attempt in range(1, 3):
-        time.sleep(0.5 + random.random() * 0.5) # sleep to avoid being banned
-                                                # if the first url didn't work
-        
-        try: # attempt original url
-            soup = get_soup(url)
-            print(f'Success\n\n') # print if first was a success
-            break 
-
-        except Exception as ex: # try second url
-            print(f'Attempt {attempt} failed on: {url}\n')
-            print(f'Attemping reconnection at: {other_url}\n\n')
-
-            sleep_s = 0.8 * (2 ** (attempt - 1)) + random.random()
-            time.sleep(sleep_s)
-            soup = get_soup(other_url)
-            break
-
-    ### scrape for basic data table
-    team_table = soup.select(f'table[id="box-{team}-game-basic"]')
-    opp_table = soup.select(f'table[id="box-{opp}-game-basic"]')
-
-    ### helper to create the dataframe
-    def parse_box_table(table):
+    ### attempt the original url, then the opposing team's url
+    ### (429 / 5xx retries and backoff are handled by the session's Retry,
+    ### and each of the two requests takes its own rate limit slot)
+    try:
+        _throttle()
+        html = get_html(url)
+
+    except requests.HTTPError:
+        print(f'Failed on: {url}, trying {other_url}\n')
+
+        ### small jittered pause between the two pages (try not to get ip banned)
+        time.sleep(0.5 + random.random())
+        _throttle()
+        html = get_html(other_url)
+
+    ### one lxml parse of the page, no bs4 tree
+    tree = lxml.html.fromstring(html)
+
+    ### helper to create the dataframe: one dict of data-stat -> text per row
+    ### (a DNP row only has its colspan 'reason' cell, so its stats stay NaN and
+    ### every column stays text; pd.read_html would copy the reason into each stat)
+    def parse_box_table(table_id):
+        table = tree.xpath('//table[@id=$tid]', tid=table_id)[0]
+
         rows = []
-        for tr in table.select("tbody tr"):
-            row_data = {}
-            for cell in tr.select("th[data-stat], td[data-stat]"):
-                key = cell["data-stat"]
-                val = cell.get_text(strip=True)
-                row_data[key] = val
+        for tr in table.xpath('./tbody/tr'):
+            row_data = {
+                cell.attrib['data-stat']: ''.join(t.strip() for t in cell.itertext())
+                for cell in tr.xpath('./*[@data-stat]')
+            }
             if row_data['player'] == 'Reserves':
                 continue
             rows.append(row_data)
-        return rows
 
-    ### Pick the first matching table 
-    team_rows = parse_box_table(team_table[0])
-    opp_rows  = parse_box_table(opp_table[0])
+        return pd.DataFrame(rows)
 
-    ### Convert to dataframe
-    team_df = pd.DataFrame(team_rows)
-    opp_df = pd.DataFrame(opp_rows)
+    ### Pick the first matching table 
+    team_df = parse_box_table(f'box-{team}-game-basic')
+    opp_df = parse_box_table(f'box-{opp}-game-basic')
 
     return team_df, opp_df
 
 # --------------------------------------------------------------------------- #
 
+def get_games_data(games, max_workers=8):
+    '''
+    Scrape the box scores for many games at once using a thread pool
+    (get_game_data rate limits every request it makes)
+
+    Args:
+        games - Dataframe with Team, Opp and URL columns 
+                (ex. get_player_data()[1])
+        max_workers - Int, number of concurrent requests
+
+    Returns:
+        list of (team_df, opp_df) in the same order as games
+    '''
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        return list(ex.map(get_game_data, games['Team'], games['Opp'], games['URL']))
+
+# --------------------------------------------------------------------------- #
+
 def get_player_data(name, season):
     '''
     Get player data 
@@ -145,32 +295,49 @@ def get_player_data(name, season):
         name - String (ex jamesle01 or murrake02)
         season - String (ex 2025) # 2025 means 2024-2025 season
     '''
-    url = f'https://www.basketball-reference.com/players/{name[0]}/{name}/gamelog/{season}/'
-    soup = get_soup(url)
+    return player_data_from_html(get_html(_gamelog_url(name, season)))
+
+def _gamelog_url(name, season):
+    '''
+    Game log url of a player for a season
+    '''
+    return f'https://www.basketball-reference.com/players/{name[0]}/{name}/gamelog/{season}/'
+
+def player_data_from_html(html):
+    '''
+    The parsing half of get_player_data, for a game log page that has
+    already been fetched (ex. by aget_many)
+
+    Args:
+        html - bytes of a player's game log page
+
+    Returns:
+        missed_reg_seas_played - Dataframe
+        reg_seas_played - Dataframe
+    '''
+    tree = parse(html)
 
     ### parse html for table data (first 7 rows are useless)
-    table = soup.find_all('td', class_=['center', 'left', 'right'])[7:]
-
-    ### extract the data from the td tags
-    data_list = []
-    for i in table:
-        data = i.get_text(strip=True)
-
-        ### account for rows of inactive games
-        if data.lower() in ['inactive', 'did not dress', 'did not play']:
-            data_list.append(data)
-            for _ in range(25):
-                data_list.append('')
-        else:
-            data_list.append(data)
-
-    ### format data for dataframe
-    rows = []
-    BATCH_SIZE = 33 # 33 columns 
-    for i in range(0, len(data_list), BATCH_SIZE):
-        curr_data = data_list[i: i+BATCH_SIZE] # row data
+    table = select_text(tree, 'td.center, td.left, td.right')[7:]
 
-        rows.append(curr_data)
+    ### inactive games only have the reason cell, so give each one the 25
+    ### blank stat cells it is missing (np.insert takes every position at once)
+    inactive = [
+        i + 1 for i, data in enumerate(table)
+        if data.lower() in ('inactive', 'did not dress', 'did not play')
+    ]
+    cells = np.insert(
+        np.asarray(table, dtype=object),
+        np.repeat(np.asarray(inactive, dtype=np.intp), 25),
+        ''
+    )
+
+    ### format data for dataframe: pad the last row, then one reshape
+    BATCH_SIZE = 33 # 33 columns 
+    cells = np.concatenate([
+        cells, np.full(-len(cells) % BATCH_SIZE, None, dtype=object)
+    ])
+    rows = cells.reshape(-1, BATCH_SIZE)
 
     ### set column names
     columns = [
@@ -183,59 +350,49 @@ def get_player_data(name, season):
     data = pd.DataFrame(rows, columns=columns)
 
     ### separate the final data tables
-    totals = data[
-        (data['Gcar'] == '') & 
-        (data['Gtm'] == '') & 
-        (data['Date'] == '') & 
-        (data['Team'] == '') & 
-        (data['at'] == '') & 
-        (data['Opp'] == '')
-    ].drop(columns=['Gcar', 'Gtm', 'Date', 'Team', 'at', 'Opp'])
-    reg_season = data.iloc[:totals.index[0]] 
+    ### totals rows are the ones with no game info; the regular season is
+    ### everything before the first of them (by position)
+    game_cols = ['Gcar', 'Gtm', 'Date', 'Team', 'at', 'Opp']
+    totals_mask = data[game_cols].eq('').all(axis=1)
+    first_totals = int(np.flatnonzero(totals_mask.to_numpy())[0])
+    reg_season = data.iloc[:first_totals]
 
     ### calculate games missed and played
-    missed_reg_seas_played = reg_season[reg_season['GS'] != '*'] ### this ###
+    started = reg_season['GS'].eq('*')
+    missed_reg_seas_played = reg_season[~started].copy()
     total_reg_seas_missed_games = len(missed_reg_seas_played)
-    reg_seas_played = reg_season[reg_season['GS'] == '*'] ### this ###
+    reg_seas_played = reg_season[started].copy()
 
     ### because 3p are 0, their percentage is also gonna be 0 or not reported
     ### therefore fill with 0 for any col of %
-    reg_seas_played[reg_seas_played['3P%'] == '']['3P']
-    reg_seas_played[reg_seas_played['3P'] == '0'].shape
-
-    for col in [c for c in reg_seas_played if '%' in c]:
-        for row in reg_seas_played.index:
-            if reg_seas_played.at[row, col] == '':
-                reg_seas_played.at[row, col] = 0
+    pct_cols = [c for c in reg_seas_played.columns if '%' in c]
+    reg_seas_played[pct_cols] = reg_seas_played[pct_cols].replace('', 0)
 
     reg_seas_played = reg_seas_played.drop(columns=['at', 'GS'])
 
-    reg_seas_played['Date'] = pd.to_datetime(reg_seas_played['Date']).dt.strftime('%Y%m%d')
-
-    result = [1 if r[0] == 'W' else 0 for r in reg_seas_played['Result']]
-    team_score = [
-        re.findall(
-            r'(?<= )\d+(?=\s*-\s*)', 
-            reg_seas_played['Result'][i])[0] for i in reg_seas_played['Result'].index
-    ]
-    opp_score = [
-        re.findall(
-            r'(?<=-)\s*\d+', 
-            reg_seas_played['Result'][i])[0] for i in reg_seas_played['Result'].index
-        ]
-
-    reg_seas_played['Result'] = result
-    reg_seas_played['Team Score'] = team_score
-    reg_seas_played['Opp Score'] = opp_score
-
-    ### convert total mins played to sec
-    def time_to_secs(time_str):
-        minutes, seconds = map(int, time_str.split(":"))
-        total_seconds = minutes * 60 + seconds  
-
-        return total_seconds
-
-    reg_seas_played['MP'] = reg_seas_played['MP'].apply(time_to_secs)
+    ### basketball-reference dates are ISO (YYYY-MM-DD): a fixed format skips
+    ### dateutil's per-element guessing
+    reg_seas_played['Date'] = pd.to_datetime(
+        reg_seas_played['Date'], format='%Y-%m-%d'
+    ).dt.strftime('%Y%m%d')
+
+    ### split 'W 110-102' into win flag, team score and opp score
+    scores = reg_seas_played['Result'].str.extract(_RESULT_RE.pattern)
+
+    reg_seas_played['Result'] = (scores[0] == 'W').astype(np.int8)
+    reg_seas_played['Team Score'] = scores[1]
+    reg_seas_played['Opp Score'] = scores[2]
+
+    ### convert total mins played to sec (blank / malformed parts count as 0)
+    mp = (
+        reg_seas_played['MP']
+        .str.split(':', expand=True)
+        .reindex(columns=[0, 1])
+        .apply(pd.to_numeric, errors='coerce')
+        .fillna(0)
+        .astype(np.int32)
+    )
+    reg_seas_played['MP'] = mp[0] * 60 + mp[1]
 
     ### calculate what percent of the score was attributed by player
     reg_seas_played['Percent Score'] = round(
@@ -243,30 +400,31 @@ def get_player_data(name, season):
         2
     )
 
-    ### convert the data to float values
+    ### convert the data to float32 values (plenty for box score stats, half
+    ### the memory of float64); residual blanks become NaN instead of raising
     to_convert = [
         'FG','FGA','FG%','3P','3PA','3P%','2P','2PA','2P%','eFG%','FT','FTA',
         'FT%','ORB','DRB','TRB','AST','STL','BLK','TOV','PF','PTS','GmSc',
-        '+/-', 'Team Score', 'Opp Score'
+        '+/-'
     ]
-    reg_seas_played[to_convert] = reg_seas_played[to_convert].astype(float)
-
-    urls = []
-    for row in reg_seas_played.index:
-        curr_data = reg_seas_played.loc[row, :]
-        curr_team = curr_data['Team']
-        curr_game_date = curr_data['Date']
-        game_url = f'https://www.basketball-reference.com/boxscores/{curr_game_date}0{curr_team}.html'
-
-        urls.append(game_url)
+    reg_seas_played[to_convert] = (
+        reg_seas_played[to_convert]
+        .apply(pd.to_numeric, errors='coerce')
+        .astype(np.float32)
+    )
 
-    reg_seas_played['URL'] = urls
+    ### scores always parse for a played game (Percent Score relies on it)
+    score_cols = ['Team Score', 'Opp Score']
+    reg_seas_played[score_cols] = reg_seas_played[score_cols].astype(np.int16)
 
-    data = soup.select('span[itemprop="name"]')
+    ### box score url for every game in one vectorized string concat
+    reg_seas_played['URL'] = (
+        'https://www.basketball-reference.com/boxscores/'
+        + reg_seas_played['Date'].astype(str) + '0'
+        + reg_seas_played['Team'].astype(str) + '.html'
+    )
 
-    names = []
-    for i in data:
-        names.append(i.get_text(strip=True))
+    names = select_text(tree, 'span[itemprop="name"]')
 
     name = names[3]
 
@@ -307,17 +465,27 @@ def get_player_data(name, season):
         "SAC", "SAS", "TOR", "UTA", "WAS", "CHO"
     ]
 
-    for team in nba_teams:
-        reg_seas_played[team] = 0
+    ### opponents outside the current franchise list (ex. SEA, NJN) get their own column
+    extra_teams = sorted(set(reg_seas_played['Opp'].dropna()) - set(nba_teams))
+    if extra_teams:
+        print(f'Unknown opponents {extra_teams}, adding them as extra columns\n')
+    all_teams = nba_teams + extra_teams
 
+    ### one contiguous int8 block, a single 1 per row in the opponent's column
     curr_team = reg_seas_played['Team'].iloc[0]
-    reg_seas_played = reg_seas_played.drop(columns=curr_team)
+    team_idx = {team: i for i, team in enumerate(all_teams)}
+
+    opp_idx = reg_seas_played['Opp'].map(team_idx).fillna(-1).to_numpy(dtype=np.int64)
+    known = opp_idx >= 0
+
+    ohe = np.zeros((len(reg_seas_played), len(all_teams)), dtype=np.int8)
+    ohe[np.flatnonzero(known), opp_idx[known]] = 1
+
+    ohe_df = pd.DataFrame(
+        ohe, columns=all_teams, index=reg_seas_played.index
+    ).drop(columns=curr_team, errors='ignore')
+    reg_seas_played = pd.concat([reg_seas_played, ohe_df], axis=1, copy=False)
 
-    for row in reg_seas_played.index:
-        curr_data = reg_seas_played.loc[row]
-        opp_team = curr_data['Opp']
-        reg_seas_played.at[row, opp_team] = 1
-    
     reg_seas_played = (
         reg_seas_played
         .drop(
@@ -326,31 +494,18 @@ def get_player_data(name, season):
         .reset_index(drop=True)
     )
 
-    # Base stats
-    rebounds = reg_seas_played['TRB']
-    assists = reg_seas_played['AST']
-    points = reg_seas_played['PTS'] * 0.5
-    turnovers = reg_seas_played['TOV'] * -1
-    steals = reg_seas_played['STL']
-    blocks = reg_seas_played['BLK']
-
     # Double/Triple doubles
     cats = ['PTS', 'TRB', 'AST', 'STL', 'BLK']
-    counts = (reg_seas_played[cats] >= 10).sum(axis=1)
-
-    reg_seas_played['double_double'] = (counts >= 2).astype(int)        # 1 point bonus
-    reg_seas_played['triple_double'] = (counts >= 3).astype(int) * 2    # 2 point bonus
-
-    # Build fantasy score
-    reg_seas_played['fantasy_score'] = (
-        rebounds
-        + assists
-        + points
-        + steals
-        + blocks
-        + turnovers
-        + reg_seas_played['double_double']
-        + reg_seas_played['triple_double']
+    counts = (reg_seas_played[cats].to_numpy() >= 10).sum(axis=1)
+
+    reg_seas_played['double_double'] = np.where(counts >= 2, 1, 0)    # 1 point bonus
+    reg_seas_played['triple_double'] = np.where(counts >= 3, 2, 0)    # 2 point bonus
+
+    # Build fantasy score in one pass instead of a temp Series per stat
+    reg_seas_played.eval(
+        'fantasy_score = TRB + AST + 0.5 * PTS + STL + BLK - TOV'
+        ' + double_double + triple_double',
+        inplace=True
     )
 
     # Optional: round for neatness
@@ -360,9 +515,99 @@ def get_player_data(name, season):
 
 # --------------------------------------------------------------------------- #
 
+def fetch_many(names, season, max_workers=4):
+    '''
+    Run get_player_data for many players at once using a thread pool
+
+    Args:
+        names - list of Strings (ex. ['jamesle01', 'murrake02'])
+        season - String (ex 2025)
+        max_workers - Int, number of players scraped concurrently
+                      (get_html caps the requests actually in flight)
+
+    Returns:
+        list of (missed_games, played_games) in the same order as names
+    '''
+    def fetch(name):
+        _throttle()
+        return get_player_data(name, season)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        return list(ex.map(fetch, names))
+
+# --------------------------------------------------------------------------- #
+
+async def _aget_html(client, url, retries=3):
+    '''
+    Async version of get_html on an httpx client. Backs off exponentially
+    (or per Retry-After) when the site answers 429 / 503
+
+    Args:
+        client - httpx.AsyncClient
+        url - String (ex. https://basketball-reference.com/)
+        retries - Int, retries on 429 / 503
+
+    Returns:
+        bytes
+    '''
+    for attempt in range(retries + 1):
+        response = await client.get(
+            url, headers={'User-Agent': random.choice(_UA_POOL)}
+        )
+        if response.status_code in (429, 503) and attempt < retries:
+            delay = retry_after_seconds(
+                response.headers.get('Retry-After'), 2 ** attempt
+            )
+            await asyncio.sleep(delay)
+            continue
+
+        response.raise_for_status()
+        return response.content
+
+async def aget_many(names, season, max_concurrency=4):
+    '''
+    get_player_data for many players on one async httpx client: no thread
+    per request, and over HTTP/2 (when h2 is installed) every page shares
+    a single multiplexed connection
+
+    Args:
+        names - list of Strings (ex. ['jamesle01', 'murrake02'])
+        season - String (ex 2025)
+        max_concurrency - Int, max requests in flight
+
+    Returns:
+        list of (missed_games, played_games) in the same order as names
+
+    Usage:
+        asyncio.run(aget_many(['jamesle01', 'murrake02'], 2025))
+    '''
+    if httpx is None:
+        raise ImportError("httpx is not installed. `pip install httpx`")
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def fetch_and_parse(client, name):
+        async with semaphore:
+            html = await _aget_html(client, _gamelog_url(name, season))
+
+        return player_data_from_html(html)
+
+    async with httpx.AsyncClient(
+        http2=importlib.util.find_spec('h2') is not None,
+        limits=httpx.Limits(max_connections=max_concurrency + 1),
+        headers={'Accept-Language': 'en-US,en;q=0.9'},
+        timeout=10,
+        follow_redirects=True
+    ) as client:
+        return await asyncio.gather(
+            *[fetch_and_parse(client, name) for name in names]
+        )
+
+# --------------------------------------------------------------------------- #
+
 from sklearn.preprocessing import StandardScaler
 from sklearn.model_selection import train_test_split
-from sklearn.linear_model import LinearRegression, Lasso, Ridge
+from sklearn.linear_model import LinearRegression, LassoCV, RidgeCV
 
 def predict_fantasy_score(player_data):
     '''
@@ -384,8 +629,11 @@ def predict_fantasy_score(player_data):
 
     # cols_to_remove = cols_to_remove + remove_perc
 
-    X = player_data.drop(columns=cols_to_remove).values
-    y = player_data[['fantasy_score']].values
+    ### keep only numeric features so a stray string column can't turn X into
+    ### an object array; float32 halves the memory sklearn has to stream
+    features = player_data.drop(columns=cols_to_remove).select_dtypes(include=[np.number])
+    X = features.to_numpy(dtype=np.float32, copy=False)
+    y = player_data['fantasy_score'].to_numpy(dtype=np.float32)
 
     scaler = StandardScaler()
 
@@ -395,28 +643,27 @@ def predict_fantasy_score(player_data):
     X_train_scaled = scaler.fit_transform(X_train)
     X_test_scaled = scaler.transform(X_test)
 
-    linreg = LinearRegression()
+    linreg = LinearRegression(copy_X=False)
     linreg.fit(X_train_scaled, y_train)
 
-    linreg_score = linreg.score(X_test_scaled, y_test)
-
     alpha_vals = [0.1, 1.0, 10.0, 100.0, 1000.0]
 
-    ridge_scores = []
-    for alpha in alpha_vals:
-        ridge = Ridge(alpha=alpha)
-        ridge.fit(X_train_scaled, y_train)
-        ridge_scores.append(ridge.score(X_test_scaled, y_test))
+    ### the CV estimators sweep every alpha in one fit (shared SVD for ridge,
+    ### warm-started coordinate descent for lasso) and keep the best one
+    ridgecv = RidgeCV(alphas=alpha_vals, scoring='r2')
+    ridgecv.fit(X_train_scaled, y_train)
 
-    lasso_scores = []
-    for alpha in alpha_vals:
-        ridge = Lasso(alpha=alpha)
-        ridge.fit(X_train_scaled, y_train)
-        lasso_scores.append(ridge.score(X_test_scaled, y_test))
+    lassocv = LassoCV(
+        alphas=alpha_vals, n_jobs=-1, selection='random', random_state=42,
+        copy_X=False
+    )
+    lassocv.fit(X_train_scaled, y_train)
 
-    scores_list = [[LinearRegression(), np.nan, linreg_score]] + \
-    [[Ridge(), alpha, score] for alpha, score in zip(alpha_vals, ridge_scores)] + \
-    [[Lasso(), alpha, score] for alpha, score in zip(alpha_vals, lasso_scores)]
+    scores_list = [
+        [linreg, np.nan, linreg.score(X_test_scaled, y_test)],
+        [ridgecv, ridgecv.alpha_, ridgecv.score(X_test_scaled, y_test)],
+        [lassocv, lassocv.alpha_, lassocv.score(X_test_scaled, y_test)]
+    ]
 
     model_selection_df = (
         pd
@@ -424,16 +671,10 @@ def predict_fantasy_score(player_data):
         .sort_values('score', ascending=False)
     )
 
-    final_model_data = model_selection_df.iloc[0]
-    final_model = final_model_data['model']
-    final_alpha = final_model_data['alpha']
-
-    if isinstance(final_alpha, float) and not pd.isna(final_alpha):
-        final_model.set_params(alpha=final_alpha)
-
-    final_model.fit(X_train_scaled, y_train)
+    ### already fit, no refit needed
+    final_model = model_selection_df.iloc[0]['model']
 
-    names = player_data.drop(columns=cols_to_remove).columns
+    names = features.columns
     model_coefs = final_model.coef_
     plt.figure(figsize=(16, 9))
     plt.bar(names, model_coefs)
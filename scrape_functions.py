@@ -1,7 +1,82 @@
-import re
+import asyncio
+import functools
+from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import Pool
+import numpy as np
 import pandas as pd
-import urllib.request
+import soupsieve as sv
+import lxml.html
+from lxml import etree
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
+from http_helpers import retry_after_seconds, throttle
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+def _make_session():
+    '''
+    Build the pooled requests session used by get_html
+
+    Keep-alive connections to basketball-reference are reused across calls
+    instead of a new TCP + TLS handshake per page. requests sends
+    Accept-Encoding gzip / deflate (plus br when brotli is installed) and
+    decodes response.content, so pages travel compressed. With
+    requests_cache installed, pages are also kept on disk for an hour so
+    repeated runs skip the network entirely. A 429 is retried after the
+    server's Retry-After instead of failing straight away
+    '''
+    if requests_cache is not None:
+        session = requests_cache.CachedSession('bbref', expire_after=3600)
+    else:
+        session = requests.Session()
+    session.mount(
+        'https://www.basketball-reference.com',
+        HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=(429, 500, 502, 503, 504),
+                respect_retry_after_header=True
+            )
+        )
+    )
+
+    return session
+
+_SESSION = _make_session()
+
+def _init_session():
+    '''
+    multiprocessing Pool initializer: give each worker process its own
+    session (connection pools can't be shared across a fork) that is then
+    reused for every task the worker runs
+    '''
+    global _SESSION
+    _SESSION = _make_session()
+
+### CSS selectors shared by every scrape, compiled once at import
+_SEL_TR = sv.compile('tr')
+_SEL_TH = sv.compile('th')
+
+@functools.lru_cache(maxsize=64)
+def _sel(css):
+    '''
+    Compile (once) a selector built at runtime, e.g. f'table#{team}'
+    '''
+    return sv.compile(css)
 
 def get_soup(url):
     '''
@@ -13,504 +88,438 @@ def get_soup(url):
     Returns:
         soup - BeautifulSoup object
     '''
-    try:
-        with urllib.request.urlopen(url) as response:
-            html = response.read()
-    except urllib.error.URLError as e:
-        print(f"Error fetching URL: {e.reason}")
-
-    ### create the soup object
-    soup = BeautifulSoup(html, 'html.parser')
+    ### create the soup object with the C-based lxml parser
+    ### (bytes, so bs4 detects the encoding itself)
+    soup = BeautifulSoup(get_html(url), 'lxml')
 
     return soup
 
-###############################################################################
-#                              Player Functions                               #
-###############################################################################
-
-### Available Functions
-###
-# player_avg_data(player_username)
-# player_sum_data(player_username)
-# player_per36_data(player_username)
-# player_advanced_data(player_username)
-# player_season_data(player_username)
-###
+def get_html(url):
+    '''
+    Fetch the raw bytes of a web url
 
-###############################################################################
-#                               Team Functions                                #
-###############################################################################
+    Args:
+        url - String (ex. https://basketball-reference.com/)
 
-### Available Functions
-###
-# all_team_historical_data()
-# team_historical_data(team)
-# team_per36_data(team, year)
-# team_avg_data(team, year)
-# team_season_data(team, year)
-###
+    Returns:
+        bytes
+    '''
+    try:
+        response = _SESSION.get(url, timeout=10)
+        response.raise_for_status()
+    except requests.RequestException as e:
+        print(f"Error fetching URL: {e}")
+        raise
 
-###############################################################################
-#                              Season Functions                               #
-###############################################################################
+    return response.content
 
-### Available Functions
-###
-# season_data()
-###
+def get_tables(url, *table_ids):
+    '''
+    Stream-parse a web url with lxml and keep only the wanted <table>s.
+    Every other table is cleared as soon as it has been parsed and no
+    bs4 tree is built, so a page costs far fewer objects than get_soup
 
-class Scrape_Functions:
+    Args:
+        url - String (ex. https://basketball-reference.com/)
+        table_ids - Strings, id attributes of the tables to keep
 
-    def __init__(self):
-        self.teams = [
-            "ATL", "BOS", "NJN", "CHI", "CLE", "DAL", "DEN", "DET", 
-            "GSW", "HOU", "IND", "LAC", "LAL", "MEM", "MIA", "MIL", 
-            "MIN", "NOH", "NYK", "OKC", "ORL", "PHI", "PHO", "POR", 
-            "SAC", "SAS", "TOR", "UTA", "WAS", "CHA"
-        ]
+    Returns:
+        list of lxml elements (None for a table that isn't on the page),
+        in the same order as table_ids
+    '''
+    found = {}
 
-# --------------------------------------------------------------------------- #
+    for _, el in etree.iterparse(BytesIO(get_html(url)), html=True, tag='table'):
+        table_id = el.get('id')
+        if table_id in table_ids and table_id not in found:
+            found[table_id] = el
+            if len(found) == len(table_ids):
+                break
+        else:
+            el.clear()
 
-    @staticmethod
-    def player_avg_data(player_username):
+    return [found.get(table_id) for table_id in table_ids]
 
-        soup = get_soup(
-            f'https://www.basketball-reference.com/players/{player_username[0]}/{player_username}.html'
-        )
+@functools.lru_cache(maxsize=16)
+def _player_soup(player_username):
+    '''
+    Soup of a player page, memoized per player so the player_*_data methods
+    share one fetch + parse. Bounded to 16 pages since a parsed page is a
+    few MB. The soup is shared between callers, so it must only be read,
+    never modified
+    '''
+    return get_soup(
+        f'https://www.basketball-reference.com/players/{player_username[0]}/{player_username}.html'
+    )
 
-        table = soup.select_one(
-            'table[data-soc-sum-table-type="PlayerPerGame"][data-soc-sum-phase-type="reg"]'
-        )
+async def _get_soup_async(session, url, retries=3):
+    '''
+    Async version of get_soup on an aiohttp session. Backs off exponentially
+    (or per Retry-After) when the site answers 429 / 503
 
-        cols = [
-            col.get_text(strip=True) for col in table.select_one('tr').select('th')
-        ]
-        NUM_COLS = len(cols)
+    Args:
+        session - aiohttp.ClientSession
+        url - String (ex. https://basketball-reference.com/)
+        retries - Int, retries on 429 / 503
 
-        rows = []
-        for tr in table.select('tbody tr'):
-            if 'class' in tr.attrs and 'thead' in tr['class']:
+    Returns:
+        soup - BeautifulSoup object
+    '''
+    for attempt in range(retries + 1):
+        async with session.get(url) as response:
+            if response.status in (429, 503) and attempt < retries:
+                delay = retry_after_seconds(
+                    response.headers.get('Retry-After'), 2 ** attempt
+                )
+                await asyncio.sleep(delay)
                 continue
 
-            cells = tr.find_all(['th', 'td'])
-            row = [c.get_text(strip=True) for c in cells]
-            if len(row) < NUM_COLS:
-                row += [''] * (NUM_COLS - len(row))
-            elif len(row) > NUM_COLS:
-                row = row[:NUM_COLS]
-            rows.append(row)
-
-        reg_season = pd.DataFrame(rows, columns=cols)
+            response.raise_for_status()
+            html = await response.read()
 
-        reg_season = reg_season[
-            reg_season.apply(lambda x: x != '')
-        ].dropna(how='all', axis=0).fillna('')
+        return BeautifulSoup(html, 'lxml')
 
-        table = soup.select_one(
-            'table[data-soc-sum-table-type="PlayerPerGame"][data-soc-sum-phase-type="post"]'
-        )
-
-        cols = [
-            col.get_text(strip=True) for col in table.select_one('tr').select('th')
-        ]
-        NUM_COLS = len(cols)
-
-        rows = []
-        for tr in table.select('tbody tr'):
-            if 'class' in tr.attrs and 'thead' in tr['class']:
-                continue
+### row selectors for _table_to_df (XPath compiled once)
+_BODY_ROWS = etree.XPath('./tbody/tr[not(contains(concat(" ", @class, " "), " thead "))]')
+_TEAMS_ROWS = etree.XPath(
+    './tbody/tr[not(contains(concat(" ", @class, " "), " thead ")'
+    ' and contains(concat(" ", th[1]/@class, " "), " left "))]'
+)
+_ALL_ROWS = etree.XPath('.//tr[not(contains(concat(" ", @class, " "), " thead "))]')
+_COL_TH = etree.XPath('.//th[@scope="col"]')
+_LAST_HEAD_COL_TH = etree.XPath('./thead/tr[last()]/th[@scope="col"]')
+_DEFAULT_SORT_TH = etree.XPath('.//th[@class="sort_default_asc center"]')
 
-            cells = tr.find_all(['th', 'td'])
-            row = [c.get_text(strip=True) for c in cells]
-            if len(row) < NUM_COLS:
-                row += [''] * (NUM_COLS - len(row))
-            elif len(row) > NUM_COLS:
-                row = row[:NUM_COLS]
-            rows.append(row)
+def _text(el):
+    '''
+    Text of an lxml element, same as bs4's get_text(strip=True)
+    '''
+    ### most cells are a single text node: read it directly in C
+    if not len(el):
+        return (el.text or '').strip()
 
-        playoff_season = pd.DataFrame(rows, columns=cols)
+    return ''.join(t.strip() for t in el.itertext())
 
-        playoff_season = playoff_season[
-            playoff_season.apply(lambda x: x != '')
-        ].dropna(how='all', axis=0).fillna('')
-            
-        reg_season['Season Type'] = 'Regular'
-        playoff_season['Season Type'] = 'Playoff'
+def _table_to_array(table, cols, rows_xpath=_BODY_ROWS):
+    '''
+    Convert an html table into a 2-D numpy object array of strings. The rows
+    and cells are pulled out by lxml's C XPath engine instead of a bs4
+    select per row
 
-        data = pd.concat([reg_season, playoff_season], axis=0)
-        data = data.reset_index(drop=True)
+    Args:
+        table - lxml element (from get_tables) or bs4 Tag of the <table>
+        cols - list of column names; rows are padded / cut to this length
+        rows_xpath - compiled XPath choosing the data rows
+                     (default: tbody rows that aren't repeated headers)
 
-        return data
+    Returns:
+        numpy array, shape (rows, len(cols))
+    '''
+    NUM_COLS = len(cols)
+    tree = table if etree.iselement(table) else lxml.html.fromstring(str(table))
 
-    # --------------------------------------------------------------------------- #
+    ### write cells straight into a preallocated object array; short rows
+    ### keep the '' fill, so no padding pass
+    trs = rows_xpath(tree)
+    arr = np.empty((len(trs), NUM_COLS), dtype=object)
+    arr.fill('')
 
-    @staticmethod
-    def player_sum_data(player_username):
+    for i, tr in enumerate(trs):
+        for j, c in zip(range(NUM_COLS), tr.iter('th', 'td')):
+            arr[i, j] = _text(c)
 
-        soup = get_soup(
-            f'https://www.basketball-reference.com/players/{player_username[0]}/{player_username}.html'
-        )
+    return arr
 
-        table = soup.select_one(
-            'table[data-soc-sum-table-type="PlayerTotals"][data-soc-sum-phase-type="reg"]'
-        )
+def _table_to_df(table, cols, rows_xpath=_BODY_ROWS):
+    '''
+    _table_to_array wrapped in a Dataframe with cols as the header
+    '''
+    return pd.DataFrame(_table_to_array(table, cols, rows_xpath), columns=cols, copy=False)
 
-        cols = [
-            col.get_text(strip=True) for col in table.select_one('tr').select('th')
-        ]
-        NUM_COLS = len(cols)
+def _split_result(df):
+    '''
+    Split the game log Result column (ex. 'W 110-102') into
+    Result ('W'), TS ('110') and OS ('102') with one vectorized extract.
+    The fixed groups keep all three columns even when the frame is empty
+    or no row has a score (unmatched rows become NaN)
+    '''
+    parts = df['Result'].astype(object).str.extract(r'^\s*(\S)\S*(?:\s+([^\s-]*)(?:-(\S*))?)?')
 
-        rows = []
-        for tr in table.select('tbody tr'):
-            if 'class' in tr.attrs and 'thead' in tr['class']:
-                continue
+    df['Result'] = parts[0]
+    df['TS'] = parts[1]
+    df['OS'] = parts[2]
 
-            cells = tr.find_all(['th', 'td'])
-            row = [c.get_text(strip=True) for c in cells]
-            if len(row) < NUM_COLS:
-                row += [''] * (NUM_COLS - len(row))
-            elif len(row) > NUM_COLS:
-                row = row[:NUM_COLS]
-            rows.append(row)
+    return df
 
-        reg_season = pd.DataFrame(rows, columns=cols)
+### 'Season Type' is stored as a categorical: one int8 code per row
+_SEASON_TYPES = ['Regular', 'Playoff']
 
-        reg_season = reg_season[
-            reg_season.apply(lambda x: x != '')
-        ].dropna(how='all', axis=0).fillna('')
+def _season_type(codes):
+    '''
+    Season Type column from int8 codes (0 = Regular, 1 = Playoff)
+    '''
+    return pd.Categorical.from_codes(codes, categories=_SEASON_TYPES)
 
-        table = soup.select_one(
-            'table[data-soc-sum-table-type="PlayerTotals"][data-soc-sum-phase-type="post"]'
-        )
+def _parse_player_table(soup, table_type, phase):
+    '''
+    Parse one of the career tables on a player page
 
-        cols = [
-            col.get_text(strip=True) for col in table.select_one('tr').select('th')
-        ]
-        NUM_COLS = len(cols)
+    Args:
+        soup - BeautifulSoup object of the player page
+        table_type - String (ex. PlayerPerGame, PlayerTotals, Advanced)
+        phase - String, 'reg' or 'post'
 
-        rows = []
-        for tr in table.select('tbody tr'):
-            if 'class' in tr.attrs and 'thead' in tr['class']:
-                continue
+    Returns:
+        cols - list of column names
+        rows - numpy object array (empty rows removed)
+    '''
+    table = _sel(
+        f'table[data-soc-sum-table-type="{table_type}"][data-soc-sum-phase-type="{phase}"]'
+    ).select_one(soup)
 
-            cells = tr.find_all(['th', 'td'])
-            row = [c.get_text(strip=True) for c in cells]
-            if len(row) < NUM_COLS:
-                row += [''] * (NUM_COLS - len(row))
-            elif len(row) > NUM_COLS:
-                row = row[:NUM_COLS]
-            rows.append(row)
+    header = _SEL_TR.select_one(table)
+    cols = [col.get_text(strip=True) for col in _SEL_TH.select(header)]
 
-        playoff_season = pd.DataFrame(rows, columns=cols)
+    rows = _table_to_array(table, cols)
 
-        playoff_season = playoff_season[
-            playoff_season.apply(lambda x: x != '')
-        ].dropna(how='all', axis=0).fillna('')
-            
-        reg_season['Season Type'] = 'Regular'
-        playoff_season['Season Type'] = 'Playoff'
+    ### keep rows with at least one non-empty cell (one vectorized compare)
+    rows = rows[(rows != '').any(axis=1)]
 
-        data = pd.concat([reg_season, playoff_season], axis=0)
-        data = data.reset_index(drop=True)
+    return cols, rows
 
-        return data
+def _player_frame(soup, table_type):
+    '''
+    Regular season + playoff rows of one career table, built into a single
+    Dataframe in one go (no per-phase frames to concat)
 
-    # --------------------------------------------------------------------------- #
+    Args:
+        soup - BeautifulSoup object of the player page
+        table_type - String (ex. PlayerPerGame, PlayerTotals, Advanced)
 
-    @staticmethod
-    def player_per36_data(player_username):
-        
-        soup = get_soup(
-            f'https://www.basketball-reference.com/players/{player_username[0]}/{player_username}.html'
-        )
+    Returns:
+        Dataframe
+    '''
+    reg_cols, reg_rows = _parse_player_table(soup, table_type, 'reg')
+    post_cols, post_rows = _parse_player_table(soup, table_type, 'post')
 
-        table = soup.select_one(
-            'table[data-soc-sum-table-type="PlayerPerMinute"][data-soc-sum-phase-type="reg"]'
+    if reg_cols == post_cols:
+        data = pd.DataFrame(
+            np.concatenate([reg_rows, post_rows]), columns=reg_cols, copy=False
         )
+    else:
+        ### headers differ: let concat line the columns up by name
+        data = pd.concat([
+            pd.DataFrame(reg_rows, columns=reg_cols),
+            pd.DataFrame(post_rows, columns=post_cols)
+        ], axis=0, ignore_index=True)
 
-        cols = [
-            col.get_text(strip=True) for col in table.select_one('tr').select('th')
-        ]
-        NUM_COLS = len(cols)
-
-        rows = []
-        for tr in table.select('tbody tr'):
-            if 'class' in tr.attrs and 'thead' in tr['class']:
-                continue
-
-            cells = tr.find_all(['th', 'td'])
-            row = [c.get_text(strip=True) for c in cells]
-            if len(row) < NUM_COLS:
-                row += [''] * (NUM_COLS - len(row))
-            elif len(row) > NUM_COLS:
-                row = row[:NUM_COLS]
-            rows.append(row)
+    data['Season Type'] = _season_type(
+        np.repeat(np.array([0, 1], dtype=np.int8), [len(reg_rows), len(post_rows)])
+    )
 
-        reg_season = pd.DataFrame(rows, columns=cols)
+    return data
 
-        reg_season = reg_season[
-            reg_season.apply(lambda x: x != '')
-        ].dropna(how='all', axis=0).fillna('')
-
-        table = soup.select_one(
-            'table[data-soc-sum-table-type="PlayerPerMinute"][data-soc-sum-phase-type="post"]'
-        )
+###############################################################################
+#                              Player Functions                               #
+###############################################################################
 
-        cols = [
-            col.get_text(strip=True) for col in table.select_one('tr').select('th')
-        ]
-        NUM_COLS = len(cols)
+### Available Functions
+###
+# player_avg_data(player_username)
+# player_sum_data(player_username)
+# player_per36_data(player_username)
+# player_advanced_data(player_username)
+# player_season_data(player_username)
+# batch_player_avg(player_usernames)   (async)
+# pool_player_avg(player_usernames)
+###
 
-        rows = []
-        for tr in table.select('tbody tr'):
-            if 'class' in tr.attrs and 'thead' in tr['class']:
-                continue
+###############################################################################
+#                               Team Functions                                #
+###############################################################################
 
-            cells = tr.find_all(['th', 'td'])
-            row = [c.get_text(strip=True) for c in cells]
-            if len(row) < NUM_COLS:
-                row += [''] * (NUM_COLS - len(row))
-            elif len(row) > NUM_COLS:
-                row = row[:NUM_COLS]
-            rows.append(row)
+### Available Functions
+###
+# all_team_historical_data()
+# team_historical_data(team)
+# team_per36_data(team, year)
+# team_avg_data(team, year)
+# team_season_data(team, year)
+# team_avg_data_bulk(teams, year)
+###
 
-        playoff_season = pd.DataFrame(rows, columns=cols)
+###############################################################################
+#                              Season Functions                               #
+###############################################################################
 
-        playoff_season = playoff_season[
-            playoff_season.apply(lambda x: x != '')
-        ].dropna(how='all', axis=0).fillna('')
-            
-        reg_season['Season Type'] = 'Regular'
-        playoff_season['Season Type'] = 'Playoff'
+### Available Functions
+###
+# season_data()
+###
 
-        data = pd.concat([reg_season, playoff_season], axis=0)
-        data = data.reset_index(drop=True)
+class Scrape_Functions:
 
-        return data
+    ### built once at class load and shared by every instance;
+    ### teams keeps the display order, _TEAMS is for membership checks
+    teams = (
+        "ATL", "BOS", "NJN", "CHI", "CLE", "DAL", "DEN", "DET", 
+        "GSW", "HOU", "IND", "LAC", "LAL", "MEM", "MIA", "MIL", 
+        "MIN", "NOH", "NYK", "OKC", "ORL", "PHI", "PHO", "POR", 
+        "SAC", "SAS", "TOR", "UTA", "WAS", "CHA"
+    )
+    _TEAMS = frozenset(teams)
 
-    # --------------------------------------------------------------------------- #
+# --------------------------------------------------------------------------- #
 
     @staticmethod
-    def player_advanced_data(player_username):
-        soup = get_soup(
-            f'https://www.basketball-reference.com/players/{player_username[0]}/{player_username}.html'
-        )
-
-        table = soup.select_one(
-            'table[data-soc-sum-table-type="Advanced"][data-soc-sum-phase-type="reg"]'
-        )
-
-        cols = [
-            col.get_text(strip=True) for col in table.select_one('tr').select('th')
-        ]
-        NUM_COLS = len(cols)
-
-        rows = []
-        for tr in table.select('tbody tr'):
-            if 'class' in tr.attrs and 'thead' in tr['class']:
-                continue
-
-            cells = tr.find_all(['th', 'td'])
-            row = [c.get_text(strip=True) for c in cells]
-            if len(row) < NUM_COLS:
-                row += [''] * (NUM_COLS - len(row))
-            elif len(row) > NUM_COLS:
-                row = row[:NUM_COLS]
-            rows.append(row)
-
-        reg_season = pd.DataFrame(rows, columns=cols)
+    def _player_table(player_username, table_type):
+        '''
+        Regular season + playoff rows of one career table on a player page.
+        The page is fetched once and shared by every table_type
 
-        reg_season = reg_season[
-            reg_season.apply(lambda x: x != '')
-        ].dropna(how='all', axis=0).fillna('')
+        Args:
+            player_username - String (ex. jamesle01)
+            table_type - String, one of PlayerPerGame, PlayerTotals,
+                         PlayerPerMinute, Advanced, Shooting
 
-        table = soup.select_one(
-            'table[data-soc-sum-table-type="Advanced"][data-soc-sum-phase-type="post"]'
-        )
-
-        cols = [
-            col.get_text(strip=True) for col in table.select_one('tr').select('th')
-        ]
-        NUM_COLS = len(cols)
-
-        rows = []
-        for tr in table.select('tbody tr'):
-            if 'class' in tr.attrs and 'thead' in tr['class']:
-                continue
-
-            cells = tr.find_all(['th', 'td'])
-            row = [c.get_text(strip=True) for c in cells]
-            if len(row) < NUM_COLS:
-                row += [''] * (NUM_COLS - len(row))
-            elif len(row) > NUM_COLS:
-                row = row[:NUM_COLS]
-            rows.append(row)
-
-        playoff_season = pd.DataFrame(rows, columns=cols)
-
-        playoff_season = playoff_season[
-            playoff_season.apply(lambda x: x != '')
-        ].dropna(how='all', axis=0).fillna('')
-            
-        reg_season['Season Type'] = 'Regular'
-        playoff_season['Season Type'] = 'Playoff'
+        Returns:
+            Dataframe
+        '''
+        soup = _player_soup(player_username)
 
-        data = pd.concat([reg_season, playoff_season], axis=0)
-        data = data.reset_index(drop=True)
-
-        return data
+        return _player_frame(soup, table_type)
 
     # --------------------------------------------------------------------------- #
 
     @staticmethod
-    def player_shooting_data(player_username):
-
-        soup = get_soup(
-            f'https://www.basketball-reference.com/players/{player_username[0]}/{player_username}.html'
-        )
-
-        table = soup.select_one(
-            'table[data-soc-sum-table-type="Shooting"][data-soc-sum-phase-type="reg"]'
-        )
-
-        cols = [
-            col.get_text(strip=True) for col in table.select_one('tr').select('th')
-        ]
-        NUM_COLS = len(cols)
-
-        rows = []
-        for tr in table.select('tbody tr'):
-            if 'class' in tr.attrs and 'thead' in tr['class']:
-                continue
-
-            cells = tr.find_all(['th', 'td'])
-            row = [c.get_text(strip=True) for c in cells]
-            if len(row) < NUM_COLS:
-                row += [''] * (NUM_COLS - len(row))
-            elif len(row) > NUM_COLS:
-                row = row[:NUM_COLS]
-            rows.append(row)
-
-        reg_season = pd.DataFrame(rows, columns=cols)
-
-        reg_season = reg_season[
-            reg_season.apply(lambda x: x != '')
-        ].dropna(how='all', axis=0).fillna('')
+    def player_avg_data(player_username):
+        return Scrape_Functions._player_table(player_username, 'PlayerPerGame')
 
-        table = soup.select_one(
-            'table[data-soc-sum-table-type="Shooting"][data-soc-sum-phase-type="post"]'
-        )
+    @staticmethod
+    def player_sum_data(player_username):
+        return Scrape_Functions._player_table(player_username, 'PlayerTotals')
 
-        cols = [
-            col.get_text(strip=True) for col in table.select_one('tr').select('th')
-        ]
-        NUM_COLS = len(cols)
+    @staticmethod
+    def player_per36_data(player_username):
+        return Scrape_Functions._player_table(player_username, 'PlayerPerMinute')
 
-        rows = []
-        for tr in table.select('tbody tr'):
-            if 'class' in tr.attrs and 'thead' in tr['class']:
-                continue
+    @staticmethod
+    def player_advanced_data(player_username):
+        return Scrape_Functions._player_table(player_username, 'Advanced')
 
-            cells = tr.find_all(['th', 'td'])
-            row = [c.get_text(strip=True) for c in cells]
-            if len(row) < NUM_COLS:
-                row += [''] * (NUM_COLS - len(row))
-            elif len(row) > NUM_COLS:
-                row = row[:NUM_COLS]
-            rows.append(row)
+    @staticmethod
+    def player_shooting_data(player_username):
+        return Scrape_Functions._player_table(player_username, 'Shooting')
 
-        playoff_season = pd.DataFrame(rows, columns=cols)
+    # --------------------------------------------------------------------------- #
 
-        playoff_season = playoff_season[
-            playoff_season.apply(lambda x: x != '')
-        ].dropna(how='all', axis=0).fillna('')
-            
-        reg_season['Season Type'] = 'Regular'
-        playoff_season['Season Type'] = 'Playoff'
+    @staticmethod
+    async def batch_player_avg(player_usernames, max_concurrency=4):
+        '''
+        Fetch player_avg_data for many players concurrently. Each fetch
+        first takes a slot from throttle() (~20 requests a minute), waited
+        for on a worker thread so the event loop keeps running
+
+        Args:
+            player_usernames - list of Strings (ex. ['jamesle01', 'curryst01'])
+            max_concurrency - Int, max requests in flight to basketball-reference
+
+        Returns:
+            list of Dataframes in the same order as player_usernames
+
+        Usage:
+            asyncio.run(Scrape_Functions.batch_player_avg(['jamesle01']))
+        '''
+        if aiohttp is None:
+            raise ImportError("aiohttp is not installed. `pip install aiohttp`")
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch_and_parse(session, player_username):
+            await asyncio.to_thread(throttle)
+            async with semaphore:
+                soup = await _get_soup_async(
+                    session,
+                    f'https://www.basketball-reference.com/players/{player_username[0]}/{player_username}.html'
+                )
+
+            return _player_frame(soup, 'PlayerPerGame')
+
+        connector = aiohttp.TCPConnector(limit_per_host=max_concurrency)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            return await asyncio.gather(
+                *[fetch_and_parse(session, u) for u in player_usernames]
+            )
 
-        data = pd.concat([reg_season, playoff_season], axis=0)
-        data = data.reset_index(drop=True)
+    # --------------------------------------------------------------------------- #
 
-        return data
+    @staticmethod
+    def pool_player_avg(player_usernames, processes=4):
+        '''
+        player_avg_data for many players, sharded across worker processes so
+        the html parsing runs on every core instead of behind the GIL.
+        Each worker would get its own throttle() bucket, so the parent
+        takes a slot before handing each player out instead
+
+        Args:
+            player_usernames - list of Strings (ex. ['jamesle01', 'curryst01'])
+            processes - Int, worker processes (None = os.cpu_count())
+
+        Returns:
+            list of Dataframes in the same order as player_usernames
+
+        Usage:
+            (call from under `if __name__ == '__main__':` on Windows / macOS)
+            Scrape_Functions.pool_player_avg(['jamesle01', 'curryst01'])
+        '''
+        def throttled(usernames):
+            ### consumed by the pool's task-feeder thread, one player per slot
+            for player_username in usernames:
+                throttle()
+                yield player_username
+
+        with Pool(processes, initializer=_init_session) as pool:
+            return list(pool.imap(Scrape_Functions.player_avg_data, throttled(player_usernames)))
 
     # --------------------------------------------------------------------------- #
 
     @staticmethod
     def player_season_data(player_username, season):    
         
-        soup = get_soup(
-            f'https://www.basketball-reference.com/players/{player_username[0]}/{player_username}/gamelog/{season}/'
+        table, post_table = get_tables(
+            f'https://www.basketball-reference.com/players/{player_username[0]}/{player_username}/gamelog/{season}/',
+            'player_game_log_reg', 'player_game_log_post'
         )
-        
-        table = soup.select_one('table#player_game_log_reg')
 
-        if not table:
+        if table is None:
             print("No Data Found")
             return
 
-        header_cells = table.select('thead tr')[-1].select('th[scope="col"]')
-        cols = [c.get_text(strip=True) for c in header_cells]
-        NUM_COLS = len(cols)
-
-        rows = []
-        for tr in table.select('tbody tr'):
-            if 'class' in tr.attrs and 'thead' in tr['class']:
-                continue
-            cells = tr.find_all(['th', 'td'])
-            row = [c.get_text(strip=True) for c in cells]
-            if len(row) < NUM_COLS:
-                row += [''] * (NUM_COLS - len(row))
-            elif len(row) > NUM_COLS:
-                row = row[:NUM_COLS]
-            rows.append(row)
+        cols = [_text(c) for c in _LAST_HEAD_COL_TH(table)]
 
-        reg_season = pd.DataFrame(rows, columns=cols)
-        reg_season['Season Type'] = 'Regular'
+        reg_season = _table_to_df(table, cols)
+        reg_season['Season Type'] = _season_type(np.zeros(len(reg_season), dtype=np.int8))
 
         ### Playoffs
 
-        table = soup.select_one('table#player_game_log_post')
+        table = post_table
 
-        if not table:
+        if table is None:
             print('No Playoff Data Found')
 
             reg_season = reg_season.drop(columns='')
 
-            reg_season['TS'] = reg_season['Result'].apply(
-                lambda x: re.findall(' [0-9]*', x)[0]
-            ).str.replace(' ', '')
-            reg_season['OS'] = reg_season['Result'].apply(
-                lambda x: re.findall('-[0-9]*', x)[0]
-            ).str.replace('-', '')
-            reg_season['Result'] = reg_season['Result'].apply(lambda x: x[0])
+            reg_season = _split_result(reg_season)
 
             return reg_season
         
-        rows = []
-        for tr in table.select('tbody tr'):
-            if 'class' in tr.attrs and 'thead' in tr['class']:
-                continue
-            cells = tr.find_all(['th', 'td'])
-            row = [c.get_text(strip=True) for c in cells]
-            if len(row) < NUM_COLS:
-                row += [''] * (NUM_COLS - len(row))
-            elif len(row) > NUM_COLS:
-                row = row[:NUM_COLS]
-            rows.append(row)
-
-        post_season = pd.DataFrame(rows, columns=cols)
-        post_season['Season Type'] = 'Playoff'
+        post_season = _table_to_df(table, cols)
+        post_season['Season Type'] = _season_type(np.ones(len(post_season), dtype=np.int8))
 
         data = pd.concat([reg_season, post_season], axis=0)
         data = data.drop(columns='')
 
-        data['TS'] = data['Result'].apply(
-            lambda x: re.findall(' [0-9]*', x)[0]
-        ).str.replace(' ', '')
-        data['OS'] = data['Result'].apply(
-            lambda x: re.findall('-[0-9]*', x)[0]
-        ).str.replace('-', '')
-        data['Result'] = data['Result'].apply(lambda x: x[0])
+        data = _split_result(data)
 
         return data
 
@@ -518,31 +527,13 @@ class Scrape_Functions:
 
     @staticmethod
     def all_team_historical_data():
-        soup = get_soup('https://www.basketball-reference.com/teams/')
-
-        teams = soup.select_one('table#teams_active')
+        teams, = get_tables(
+            'https://www.basketball-reference.com/teams/', 'teams_active'
+        )
 
-        cols = [
-            col.get_text(strip=True) for col in teams.select('th[scope="col"]')
-        ]
+        cols = [_text(col) for col in _COL_TH(teams)]
 
-        NUM_COLS = len(cols)
-        rows = []
-        for tr in teams.select('tbody tr'):
-            if 'left' in tr.select_one('th')['class'] \
-            and 'class' in tr.attrs \
-            and 'thead' in tr['class']:
-                continue
-            
-            cells = tr.find_all(['th', 'td'])
-            row = [c.get_text(strip=True) for c in cells]
-            if len(row) < NUM_COLS:
-                row += [''] * (NUM_COLS - len(row))
-            elif len(row) > NUM_COLS:
-                row = row[:NUM_COLS]
-            rows.append(row)
-            
-        teams = pd.DataFrame(rows, columns=cols)
+        teams = _table_to_df(teams, cols, _TEAMS_ROWS)
 
         return teams
 
@@ -550,178 +541,127 @@ class Scrape_Functions:
 
     def team_historical_data(self, team):
 
-        if team not in self.teams:
+        if team not in self._TEAMS:
             print(f'Team {team} Not Found')
             return 
 
-        soup = get_soup(f'https://www.basketball-reference.com/teams/{team}/')
-
-        table = soup.select_one(f'table#{team}')
+        table, = get_tables(
+            f'https://www.basketball-reference.com/teams/{team}/', team
+        )
 
-        if not table:
+        if table is None:
             print(f'No Data Found ({team})')
             return
 
-        cols = [
-            col.get_text(strip=True) for col in table.select('th[scope="col"]')
-        ]
-        NUM_COLS = len(cols)
+        cols = [_text(col) for col in _COL_TH(table)]
 
-        rows = []
-        for tr in table.select('tbody tr'):
-            if 'class' in tr.attrs and 'thead' in tr['class']:
-                continue
-
-            cells = tr.find_all(['th', 'td'])
-            row = [c.get_text(strip=True) for c in cells]
-            if len(row) < NUM_COLS:
-                row += [''] * (NUM_COLS - len(row))
-            elif len(row) > NUM_COLS:
-                row = row[:NUM_COLS]
-            rows.append(row)
-            
-        return pd.DataFrame(rows, columns=cols)
+        return _table_to_df(table, cols)
 
     # --------------------------------------------------------------------------- #
 
     def team_season_data(self, team, year):
 
-        if team not in self.teams:
+        if team not in self._TEAMS:
             print(f'Team {team} Not Found')
             return 
         
-        soup = get_soup(
-            f'https://www.basketball-reference.com/teams/{team}/{year}.html'
+        table, = get_tables(
+            f'https://www.basketball-reference.com/teams/{team}/{year}.html',
+            'roster'
         )
 
-        table = soup.select_one('table#roster')
-
-        if not table:
+        if table is None:
             print(f'No Data Found ({team})')
             return
 
-        cols = [
-            col.get_text(strip=True) for col in table.select('th[scope="col"]')
-        ]
-        NUM_COLS = len(cols)
+        cols = [_text(col) for col in _COL_TH(table)]
 
-        rows = []
-        for tr in table.select('tbody tr'):
-            if 'class' in tr.attrs and 'thead' in tr['class']:
-                continue
-            
-            cells = tr.find_all(['th', 'td'])
-            row = [c.get_text(strip=True) for c in cells]
-            if len(row) < NUM_COLS:
-                row += [''] * (NUM_COLS - len(row))
-            elif len(row) > NUM_COLS:
-                row = row[:NUM_COLS]
-            rows.append(row)
-
-        return pd.DataFrame(rows, columns=cols)
+        return _table_to_df(table, cols)
 
     # --------------------------------------------------------------------------- #
 
     def team_avg_data(self, team, year):
 
-        if team not in self.teams:
+        if team not in self._TEAMS:
             print(f'Team {team} Not Found')
             return
 
-        soup = get_soup(
-            f'https://www.basketball-reference.com/teams/{team}/{year}.html'
+        table, = get_tables(
+            f'https://www.basketball-reference.com/teams/{team}/{year}.html',
+            'per_game_stats'
         )
-        
-        table = soup.select_one('table#per_game_stats')
 
-        if not table:
+        if table is None:
             print(f'No Data Found ({team})')
-            return 
-
-        cols = [col.get_text(strip=True) for col in table.select('th[scope="col"]')]
-        NUM_COLS = len(cols)
+            return
 
-        rows = []
-        for tr in table.select('tbody tr'):
-            if 'class' in tr.attrs and 'thead' in tr['class']:
-                continue
-            
-            cells = tr.find_all(['th', 'td'])
-            row = [c.get_text(strip=True) for c in cells]
-            if len(row) < NUM_COLS:
-                row += [''] * (NUM_COLS - len(row))
-            elif len(row) > NUM_COLS:
-                row = row[:NUM_COLS]
-            rows.append(row)
+        cols = [_text(col) for col in _COL_TH(table)]
 
-        return pd.DataFrame(rows, columns=cols)
+        return _table_to_df(table, cols)
 
     # --------------------------------------------------------------------------- #
 
     def team_per36_data(self, team, year):
 
-        if team not in self.teams:
+        if team not in self._TEAMS:
             print(f'Team {team} Not Found')
             return
         
-        soup = get_soup(
-            f'https://www.basketball-reference.com/teams/{team}/{year}.html'
+        table, = get_tables(
+            f'https://www.basketball-reference.com/teams/{team}/{year}.html',
+            'per_minute_stats'
         )
-        
-        table = soup.select_one('table#per_minute_stats')
 
-        if not table:
+        if table is None:
             print(f'No Data Found ({team})')
-            return 
+            return
 
-        cols = [col.get_text(strip=True) for col in table.select('th[scope="col"]')]
-        NUM_COLS = len(cols)
+        cols = [_text(col) for col in _COL_TH(table)]
 
-        rows = []
-        for tr in table.select('tbody tr'):
-            if 'class' in tr.attrs and 'thead' in tr['class']:
-                continue
-            
-            cells = tr.find_all(['th', 'td'])
-            row = [c.get_text(strip=True) for c in cells]
-            if len(row) < NUM_COLS:
-                row += [''] * (NUM_COLS - len(row))
-            elif len(row) > NUM_COLS:
-                row = row[:NUM_COLS]
-            rows.append(row)
+        return _table_to_df(table, cols)
+
+    # --------------------------------------------------------------------------- #
+
+    def team_avg_data_bulk(self, teams, year, max_workers=4):
+        '''
+        team_avg_data for many teams at once, fetched on a thread pool
 
-        return pd.DataFrame(rows, columns=cols)
+        basketball-reference starts answering 429 at roughly 20 requests
+        a minute, so every fetch first takes a slot from throttle(); a full
+        30 team sweep takes a bit over a minute instead of getting the IP
+        rate limited
+
+        Args:
+            teams - list of Strings (ex. ['LAL', 'BOS'])
+            year - Int (ex. 2024)
+            max_workers - Int, max requests in flight
+
+        Returns:
+            dict of team -> Dataframe (None for unknown teams / no data)
+        '''
+        def fetch(team):
+            ### unknown teams return before any request is made
+            if team in self._TEAMS:
+                throttle()
+            return self.team_avg_data(team, year)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as ex:
+            return dict(zip(teams, ex.map(fetch, teams)))
 
     # --------------------------------------------------------------------------- #
 
     @staticmethod
     def season_data():
-        soup = get_soup(
-            f'http://basketball-reference.com/leagues/'
+        table, = get_tables(
+            f'http://basketball-reference.com/leagues/', 'stats'
         )
-        
-        table = soup.select_one('table#stats')
 
-        if not table:
+        if table is None:
             print('No Data Found')
             return
 
-        cols = [col.get_text(strip=True) for col in table.select('th[class="sort_default_asc center"]')]
-        NUM_COLS = len(cols)
-
-        rows = []
-        for tr in table.select('tr'):
-            if 'class' in tr.attrs and 'thead' in tr['class']:
-                continue
-
-            cells = tr.find_all(['th', 'td'])
-            row = [c.get_text(strip=True) for c in cells]
-            if len(row) < NUM_COLS:
-                row += [''] * (NUM_COLS - len(row))
-            elif len(row) > NUM_COLS:
-                row = row[:NUM_COLS]
-            rows.append(row)
+        cols = [_text(col) for col in _DEFAULT_SORT_TH(table)]
 
-        return pd.DataFrame(rows, columns=cols)
+        return _table_to_df(table, cols, _ALL_ROWS)
 
     # --------------------------------------------------------------------------- #